@@ -9,23 +9,29 @@ Usage:
     ccusage status       Same as above
     ccusage json         Print raw JSON
     ccusage daemon       Run in foreground, refresh every 5 min, write to ~/.claude/usage-limits.json
+                         (-i/--interval SECS to change the refresh interval)
     ccusage statusline   Claude Code statusline command (reads stdin + cache)
     ccusage install      Print setup instructions
 """
 
-import argparse
+from __future__ import annotations
+
+# Network and signal imports are deferred to the functions that use
+# them so the per-prompt `statusline` command doesn't pay for ssl/http.client.
 import json
 import os
-import signal
-import subprocess
 import sys
 import time
-import urllib.error
-import urllib.request
 from datetime import datetime, timezone
 from pathlib import Path
 
 _TTY = sys.stdout.isatty()
+HOME_STR = str(Path.home())
+HOME_PREFIX = HOME_STR + os.sep
+
+# Percentage colors (green, yellow, red), indexed by (pct >= 50) + (pct >= 70)
+_PCT_COLORS = ("\033[0;32m", "\033[0;33m", "\033[0;31m")
+_NO_COLORS = ("", "", "")
 
 
 def _resolve_claude_path(relative: str) -> Path:
@@ -38,11 +44,13 @@ def _resolve_claude_path(relative: str) -> Path:
     Args:
         relative: path relative to the .claude directory, e.g. ".credentials.json"
     """
-    native = Path.home() / ".claude" / relative
+    native = CLAUDE_DIR / relative
     if native.exists() or sys.platform != "win32":
         return native
 
     # Windows: try WSL paths
+    import subprocess
+
     try:
         out = subprocess.run(
             ["wsl", "-l", "-q"],
@@ -67,20 +75,38 @@ def _resolve_claude_path(relative: str) -> Path:
     return native
 
 
-CLAUDE_DIR = Path.home() / ".claude"
+CLAUDE_DIR = Path(HOME_STR) / ".claude"
 CREDENTIALS_FILE = _resolve_claude_path(".credentials.json")
 USAGE_FILE = _resolve_claude_path("usage-limits.json")
+SOCKET_FILE = CLAUDE_DIR / "ccusage.sock"
 DAEMON_INTERVAL = 300  # 5 minutes
+USAGE_HOST = "api.anthropic.com"
+USAGE_PATH = "/api/oauth/usage"
 TOKEN_URL = "https://console.anthropic.com/v1/oauth/token"
 CLIENT_ID = "9d1c250a-e61b-44d9-88ed-5944d1962f5e"  # Claude Code's public OAuth client
 
 
+_creds_cache: tuple[tuple, dict] | None = None
+
+
 def get_credentials() -> dict | None:
-    """Read OAuth credentials from Claude Code's credentials file."""
+    """Read OAuth credentials from Claude Code's credentials file.
+
+    The parsed result is memoized on the file's path, mtime and size, so
+    repeated calls (e.g. every daemon tick) only re-parse after Claude Code
+    or a token refresh rewrites the file.
+    """
+    global _creds_cache
     try:
-        return json.loads(CREDENTIALS_FILE.read_text())
+        st = CREDENTIALS_FILE.stat()
+        key = (str(CREDENTIALS_FILE), st.st_mtime_ns, st.st_size)
+        if _creds_cache is not None and _creds_cache[0] == key:
+            return _creds_cache[1]
+        creds = json.loads(CREDENTIALS_FILE.read_bytes())
     except (FileNotFoundError, json.JSONDecodeError):
         return None
+    _creds_cache = (key, creds)
+    return creds
 
 
 def get_plan(creds: dict | None = None) -> str:
@@ -99,13 +125,18 @@ def refresh_credentials(creds: dict) -> dict:
 
     Anthropic rotates refresh tokens, so the new refreshToken MUST be written
     back to .credentials.json or Claude Code's stored one goes stale and the
-    user gets logged out.
+    user gets logged out. The credentials cache is primed with the result so
+    the next get_credentials() doesn't re-parse what was just written.
     """
+    global _creds_cache
     oauth = creds.get("claudeAiOauth", {})
     refresh_token = oauth.get("refreshToken")
     if not refresh_token:
         raise RuntimeError("OAuth token expired and no refresh token — open Claude Code to log in")
 
+    import urllib.error
+    import urllib.request
+
     payload = json.dumps({
         "grant_type": "refresh_token",
         "refresh_token": refresh_token,
@@ -136,13 +167,95 @@ def refresh_credentials(creds: dict) -> dict:
         with os.fdopen(fd, "w") as f:
             f.write(json.dumps(updated))
         os.replace(tmp, CREDENTIALS_FILE)
+        st = CREDENTIALS_FILE.stat()
+        _creds_cache = ((str(CREDENTIALS_FILE), st.st_mtime_ns, st.st_size), updated)
     except OSError as e:
         print(f"Warning: refreshed token but could not write {CREDENTIALS_FILE}: {e}", file=sys.stderr)
 
     return updated
 
 
-def fetch_usage() -> dict:
+_conn = None  # http.client.HTTPSConnection, opened by _get_conn()
+
+
+def _get_conn():
+    """Return the persistent connection to the usage API, opening it lazily.
+
+    Honors HTTPS_PROXY/NO_PROXY like urlopen does: when a proxy applies, the
+    connection goes to the proxy and CONNECT-tunnels to the API host.
+    """
+    global _conn
+    import base64
+    import http.client
+    import urllib.parse
+    import urllib.request
+
+    if _conn is None:
+        proxy = urllib.request.getproxies().get("https")
+        if proxy and not urllib.request.proxy_bypass(USAGE_HOST):
+            url = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+            headers = {}
+            if url.username:
+                userpass = f"{urllib.parse.unquote(url.username)}:{urllib.parse.unquote(url.password or '')}"
+                headers["Proxy-Authorization"] = "Basic " + base64.b64encode(userpass.encode()).decode()
+            _conn = http.client.HTTPSConnection(url.hostname, url.port or 80, timeout=10)
+            _conn.set_tunnel(USAGE_HOST, 443, headers=headers)
+        else:
+            _conn = http.client.HTTPSConnection(USAGE_HOST, timeout=10)
+    return _conn
+
+
+def _close_conn():
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
+
+
+def _get_usage_once(headers: dict) -> bytes:
+    import io
+    import urllib.error
+
+    conn = _get_conn()
+    try:
+        conn.request("GET", USAGE_PATH, headers=headers)
+        resp = conn.getresponse()
+        body = resp.read()
+    except Exception:
+        _close_conn()
+        raise
+    if resp.status >= 400:
+        raise urllib.error.HTTPError(
+            f"https://{USAGE_HOST}{USAGE_PATH}", resp.status, resp.reason, resp.headers, io.BytesIO(body),
+        )
+    return body
+
+
+def _get_usage_keepalive(headers: dict) -> bytes:
+    """GET the usage endpoint over the persistent connection.
+
+    Reuses the TLS session across daemon ticks instead of paying a full
+    handshake each time. An idle connection can die in many ways (server
+    close, NAT timeout or suspend leading to a read timeout, TLS EOF), so any
+    connection-level error on a reused connection reconnects once and retries.
+    HTTP errors are raised as urllib.error.HTTPError so callers handle both
+    transports the same way, and are never retried here.
+    """
+    import http.client
+    import urllib.error
+
+    reused = _get_conn().sock is not None
+    try:
+        return _get_usage_once(headers)
+    except urllib.error.HTTPError:
+        raise
+    except (http.client.BadStatusLine, OSError):  # OSError covers ssl.SSLError, TimeoutError
+        if not reused:
+            raise
+        return _get_usage_once(headers)
+
+
+def fetch_usage(creds: dict | None = None, keep_alive: bool = False) -> dict:
     """Fetch usage from Anthropic's /api/oauth/usage endpoint.
 
     Reads the OAuth token from ~/.claude/.credentials.json, auto-refreshing it
@@ -150,6 +263,11 @@ def fetch_usage() -> dict:
     The key header is `anthropic-beta: oauth-2025-04-20` — without it, the
     endpoint returns an auth error.
 
+    Pass already-loaded `creds` to skip reading the credentials file again.
+    With keep_alive=True (daemon mode) the request goes over a module-level
+    HTTPSConnection that stays open between calls; otherwise a one-shot
+    urlopen is used.
+
     Returns the raw API response, e.g.:
         {
             "five_hour": {"utilization": 35.0, "resets_at": "..."},
@@ -159,7 +277,11 @@ def fetch_usage() -> dict:
             "extra_usage": {"is_enabled": true, "monthly_limit": 100000, ...}
         }
     """
-    creds = get_credentials()
+    import urllib.error
+    import urllib.request
+
+    if creds is None:
+        creds = get_credentials()
     if not creds:
         raise RuntimeError("No credentials at ~/.claude/.credentials.json — run `claude` first")
 
@@ -175,16 +297,16 @@ def fetch_usage() -> dict:
         token = creds["claudeAiOauth"]["accessToken"]
 
     for attempt in range(2):
-        req = urllib.request.Request(
-            "https://api.anthropic.com/api/oauth/usage",
-            headers={
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json",
-                "User-Agent": "claude-code/2.1.71",
-                "anthropic-beta": "oauth-2025-04-20",
-            },
-        )
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+            "User-Agent": "claude-code/2.1.71",
+            "anthropic-beta": "oauth-2025-04-20",
+        }
         try:
+            if keep_alive:
+                return json.loads(_get_usage_keepalive(headers))
+            req = urllib.request.Request(f"https://{USAGE_HOST}{USAGE_PATH}", headers=headers)
             with urllib.request.urlopen(req, timeout=10) as resp:
                 return json.loads(resp.read())
         except urllib.error.HTTPError as e:
@@ -197,6 +319,33 @@ def fetch_usage() -> dict:
     raise RuntimeError("Failed to fetch usage after token refresh")
 
 
+def _iso_to_epoch(iso: str) -> int:
+    """Convert an ISO-8601 timestamp to whole Unix seconds.
+
+    The API and build_usage_json both emit `YYYY-MM-DDTHH:MM:SS[.ffffff]`
+    followed by `Z` or `±HH:MM`, which is slice-parsed with plain integer
+    arithmetic. Anything else falls back to datetime.fromisoformat.
+    """
+    tz = iso[-6:]
+    if (
+        len(iso) >= 20 and iso[10] == "T" and iso[16] == ":" and iso[19] in ".Z+-"
+        and (iso[-1] == "Z" or (tz[0] in "+-" and tz[3] == ":"))
+    ):
+        # Days since the epoch from the civil date (proleptic Gregorian)
+        y, m, d = int(iso[0:4]), int(iso[5:7]), int(iso[8:10])
+        y -= m <= 2
+        era = y // 400
+        yoe = y - era * 400
+        doy = (153 * (m - 3 if m > 2 else m + 9) + 2) // 5 + d - 1
+        days = era * 146097 + yoe * 365 + yoe // 4 - yoe // 100 + doy - 719468
+        secs = days * 86400 + int(iso[11:13]) * 3600 + int(iso[14:16]) * 60 + int(iso[17:19])
+        if iso[-1] != "Z":
+            offset = int(tz[1:3]) * 3600 + int(tz[4:6]) * 60
+            secs += -offset if tz[0] == "+" else offset
+        return secs
+    return int(datetime.fromisoformat(iso).timestamp())
+
+
 def build_usage_json(api_data: dict, plan: str) -> dict:
     """Transform API response into our cached format."""
     result = {
@@ -204,18 +353,15 @@ def build_usage_json(api_data: dict, plan: str) -> dict:
         "source": "api",
         "updated_at": datetime.now(timezone.utc).isoformat(),
     }
-    for key, api_key in [
-        ("5h", "five_hour"),
-        ("7d", "seven_day"),
-        ("7d_sonnet", "seven_day_sonnet"),
-        ("7d_opus", "seven_day_opus"),
-    ]:
-        bucket = api_data.get(api_key)
-        if bucket:
-            result[key] = {
-                "pct": bucket["utilization"],
-                "resets_at": bucket.get("resets_at"),
-            }
+    # Four fixed buckets, unrolled rather than looped over a mapping
+    if b := api_data.get("five_hour"):
+        result["5h"] = {"pct": b["utilization"], "resets_at": b.get("resets_at")}
+    if b := api_data.get("seven_day"):
+        result["7d"] = {"pct": b["utilization"], "resets_at": b.get("resets_at")}
+    if b := api_data.get("seven_day_sonnet"):
+        result["7d_sonnet"] = {"pct": b["utilization"], "resets_at": b.get("resets_at")}
+    if b := api_data.get("seven_day_opus"):
+        result["7d_opus"] = {"pct": b["utilization"], "resets_at": b.get("resets_at")}
     extra = api_data.get("extra_usage")
     if extra:
         result["extra_usage"] = extra
@@ -223,40 +369,53 @@ def build_usage_json(api_data: dict, plan: str) -> dict:
 
 
 def write_usage_file(data: dict):
-    """Write usage data to ~/.claude/usage-limits.json."""
-    USAGE_FILE.write_text(json.dumps(data, indent=2) + "\n")
+    """Write usage data to ~/.claude/usage-limits.json.
+
+    Written compactly to a temp file and renamed into place, so statusline
+    readers never see a half-written file.
+    """
+    import tempfile
+
+    # Unique temp name per writer: the daemon and any statusline process
+    # refreshing a stale cache may write at the same time.
+    fd, tmp = tempfile.mkstemp(dir=USAGE_FILE.parent, prefix=USAGE_FILE.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(data, separators=(",", ":")) + "\n")
+        os.replace(tmp, USAGE_FILE)
+    except BaseException:
+        os.unlink(tmp)
+        raise
 
 
 # -- CLI commands --
 
 def cmd_status(raw_json=False):
     """Fetch and display current usage."""
-    api_data = fetch_usage()
-    plan = get_plan()
+    creds = get_credentials()
+    api_data = fetch_usage(creds)
+    plan = get_plan(creds)
     data = build_usage_json(api_data, plan)
 
     if raw_json:
         print(json.dumps(data, indent=2))
         return
 
-    R = "\033[0;31m" if _TTY else ""
-    Y = "\033[0;33m" if _TTY else ""
-    G = "\033[0;32m" if _TTY else ""
+    pct_colors = _PCT_COLORS if _TTY else _NO_COLORS
     D = "\033[0;90m" if _TTY else ""
     RST = "\033[0m" if _TTY else ""
 
     def color_pct(pct):
         p = int(pct)
-        c = R if p >= 70 else Y if p >= 50 else G
-        return f"{c}{p}%{RST}"
+        return f"{pct_colors[(p >= 50) + (p >= 70)]}{p}%{RST}"
+
+    now = time.time()
 
     def fmt_reset(iso):
         if not iso:
             return ""
         try:
-            reset = datetime.fromisoformat(iso)
-            now = datetime.now(timezone.utc)
-            secs = int((reset - now).total_seconds())
+            secs = _iso_to_epoch(iso) - int(now)
             if secs <= 0:
                 return ""
             m = secs // 60
@@ -286,20 +445,45 @@ def cmd_status(raw_json=False):
         print(f"  {'Extra usage':20s} ${used:.2f} / ${limit:.2f}")
 
 
+def _next_deadline(deadline: float, step: float, interval: float) -> float:
+    """Return the monotonic time of the next daemon tick.
+
+    Advances `deadline` by `step` (the interval, or the current backoff). If
+    the last tick overran past that, whole intervals are skipped so missed
+    ticks aren't fired back to back.
+    """
+    deadline += step
+    now = time.monotonic()
+    if deadline < now:
+        deadline += ((now - deadline) // interval + 1) * interval
+    return deadline
+
+
 def cmd_daemon(interval: int = DAEMON_INTERVAL):
     """Run in foreground, refresh every `interval` seconds."""
+    if interval < 1:
+        raise ValueError(f"Refresh interval must be a positive number of seconds, got {interval}")
+
+    import signal
+    import urllib.error
+
     signal.signal(signal.SIGINT, lambda *_: sys.exit(0))
     if hasattr(signal, "SIGTERM"):
         signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
 
     print(f"ccusage daemon started (refreshing every {interval}s)")
     print(f"Writing to {USAGE_FILE}")
+    if _start_statusline_server():
+        print(f"Serving statusline on {SOCKET_FILE}")
 
     backoff = 0
+    next_tick = time.monotonic()
     while True:
+        now_str = time.strftime("%H:%M:%S")
         try:
-            api_data = fetch_usage()
-            plan = get_plan()
+            creds = get_credentials()
+            plan = get_plan(creds)
+            api_data = fetch_usage(creds, keep_alive=True)
             data = build_usage_json(api_data, plan)
             write_usage_file(data)
             backoff = 0
@@ -308,62 +492,82 @@ def cmd_daemon(interval: int = DAEMON_INTERVAL):
                 b = data.get(key)
                 if b:
                     pcts.append(f"{key}:{int(b['pct'])}%")
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] {' '.join(pcts)}")
+            print(f"[{now_str}] {' '.join(pcts)}")
         except urllib.error.HTTPError as e:
             if e.code == 429:
                 backoff = min((backoff or interval) * 2, 3600)
-                print(f"[{datetime.now().strftime('%H:%M:%S')}] 429 — backing off {backoff}s", file=sys.stderr)
+                print(f"[{now_str}] 429 — backing off {backoff}s", file=sys.stderr)
             else:
-                print(f"[{datetime.now().strftime('%H:%M:%S')}] Error: {e}", file=sys.stderr)
+                print(f"[{now_str}] Error: {e}", file=sys.stderr)
         except Exception as e:
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] Error: {e}", file=sys.stderr)
+            print(f"[{now_str}] Error: {e}", file=sys.stderr)
+
+        # Sleep until an absolute monotonic deadline so fetch latency doesn't
+        # accumulate as drift.
+        next_tick = _next_deadline(next_tick, backoff or interval, interval)
+        time.sleep(max(0, next_tick - time.monotonic()))
 
-        time.sleep(backoff or interval)
+
+_usage_cache: tuple[tuple, dict] | None = None
+
+
+def _read_usage_file(st: os.stat_result | None = None) -> dict:
+    """Parse the usage cache file, reusing the previous parse if it hasn't changed."""
+    global _usage_cache
+    if st is None:
+        st = USAGE_FILE.stat()
+    key = (str(USAGE_FILE), st.st_mtime_ns, st.st_size)
+    if _usage_cache is not None and _usage_cache[0] == key:
+        return _usage_cache[1]
+    usage = json.loads(USAGE_FILE.read_bytes())
+    _usage_cache = (key, usage)
+    return usage
 
 
 def _get_cached_usage(max_age: int = DAEMON_INTERVAL) -> dict:
     """Read cached usage, refreshing from API if stale or missing."""
     try:
-        usage = json.loads(USAGE_FILE.read_text())
-        updated = datetime.fromisoformat(usage["updated_at"])
-        age = (datetime.now(timezone.utc) - updated).total_seconds()
-        if age < max_age:
-            return usage
+        st = USAGE_FILE.stat()
+        # The file is rewritten on every refresh, so an old mtime already
+        # means stale data — skip parsing it in that case.
+        if time.time() - st.st_mtime < max_age:
+            usage = _read_usage_file(st)
+            if time.time() - _iso_to_epoch(usage["updated_at"]) < max_age:
+                return usage
     except Exception:
         pass
     # Cache is stale or missing — try to refresh
     try:
-        api_data = fetch_usage()
-        usage = build_usage_json(api_data, get_plan())
+        creds = get_credentials()
+        api_data = fetch_usage(creds)
+        usage = build_usage_json(api_data, get_plan(creds))
         write_usage_file(usage)
         return usage
     except Exception:
         # Return whatever we had, even if stale
         try:
-            return json.loads(USAGE_FILE.read_text())
+            return _read_usage_file()
         except Exception:
             return {}
 
 
-def cmd_statusline():
-    """Claude Code statusline command. Reads Claude's JSON from stdin + cached usage."""
-    R = "\033[0;31m" if _TTY else ""
-    Y = "\033[0;33m" if _TTY else ""
-    G = "\033[0;32m" if _TTY else ""
-    C = "\033[0;36m" if _TTY else ""
-    D = "\033[0;90m" if _TTY else ""
-    RST = "\033[0m" if _TTY else ""
+def _render_statusline(cc: dict, usage: dict, color: bool) -> str:
+    """Format the statusline from Claude Code's JSON and cached usage data."""
+    pct_colors = _PCT_COLORS if color else _NO_COLORS
+    C = "\033[0;36m" if color else ""
+    D = "\033[0;90m" if color else ""
+    RST = "\033[0m" if color else ""
 
     def color_pct(pct: int) -> str:
-        c = R if pct >= 70 else Y if pct >= 50 else G
-        return f"{c}{pct}%{RST}"
+        return f"{pct_colors[(pct >= 50) + (pct >= 70)]}{pct}%{RST}"
+
+    now = time.time()
 
     def fmt_reset(iso: str | None) -> str:
         if not iso:
             return ""
         try:
-            reset = datetime.fromisoformat(iso)
-            secs = int((reset - datetime.now(timezone.utc)).total_seconds())
+            secs = _iso_to_epoch(iso) - int(now)
             if secs <= 0:
                 return ""
             m = secs // 60
@@ -373,24 +577,18 @@ def cmd_statusline():
         except Exception:
             return ""
 
-    # Read Claude Code's JSON from stdin
-    try:
-        cc = json.loads(sys.stdin.read())
-    except Exception:
-        cc = {}
-
     model = cc.get("model", {}).get("display_name", "?")
     cost = cc.get("cost", {}).get("total_cost_usd", 0)
     pwd = cc.get("workspace", {}).get("current_dir", "?")
-    home = str(Path.home())
-    if pwd.startswith(home):
-        pwd = "~" + pwd[len(home):]
+    # Match on HOME_STR + separator so a sibling like /home/alice2 isn't
+    # abbreviated as ~2 for /home/alice.
+    if pwd == HOME_STR:
+        pwd = "~"
+    elif pwd.startswith(HOME_PREFIX):
+        pwd = "~" + pwd[len(HOME_STR):]
 
     cost_fmt = f"${cost:.2f}" if cost > 0 else "$0"
 
-    # Read cached usage, refresh if stale or missing
-    usage = _get_cached_usage()
-
     plan = usage.get("plan", "?")
     five_h = usage.get("5h", {})
     seven_d = usage.get("7d", {})
@@ -411,53 +609,172 @@ def cmd_statusline():
     if reset:
         parts.append(f"| {D}reset:{reset}{RST}")
 
-    print(" ".join(parts))
+    return " ".join(parts)
+
+
+def cmd_statusline(raw: str | bytes | None = None):
+    """Claude Code statusline command. Reads Claude's JSON from stdin + cached usage."""
+    # Read Claude Code's JSON from stdin (or `raw`, when forwarded by the client)
+    try:
+        cc = json.loads(sys.stdin.buffer.read() if raw is None else raw)
+    except Exception:
+        cc = {}
+
+    # Read cached usage, refresh if stale or missing
+    print(_render_statusline(cc, _get_cached_usage(), _TTY))
+
+
+def _start_statusline_server():
+    """Serve rendered statuslines on SOCKET_FILE from a background thread.
+
+    Each connection sends Claude Code's statusline JSON, closes its write
+    side, and reads back one rendered line built from the usage file this
+    daemon keeps fresh. Lines are uncolored, as Claude Code pipes the output.
+    Returns the server, or None where Unix sockets aren't available or
+    another daemon is already serving the socket.
+    """
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    import atexit
+    import socketserver
+    import threading
+
+    class Handler(socketserver.StreamRequestHandler):
+        timeout = 2
+
+        def handle(self):
+            try:
+                cc = json.loads(self.rfile.read())
+            except Exception:
+                cc = {}
+            try:
+                usage = _read_usage_file()
+            except Exception:
+                usage = {}
+            try:
+                self.wfile.write((_render_statusline(cc, usage, color=False) + "\n").encode())
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # client went away, e.g. another daemon's liveness probe
+
+    # Don't take over a socket a live daemon is still serving; only a stale
+    # one left behind by a daemon that died is replaced.
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        probe.settimeout(1)
+        try:
+            probe.connect(str(SOCKET_FILE))
+        except OSError:
+            SOCKET_FILE.unlink(missing_ok=True)
+        else:
+            print(f"Warning: another daemon is already serving {SOCKET_FILE}", file=sys.stderr)
+            return None
+    try:
+        server = socketserver.ThreadingUnixStreamServer(str(SOCKET_FILE), Handler)
+        os.chmod(SOCKET_FILE, 0o600)
+    except OSError as e:
+        print(f"Warning: could not serve statusline on {SOCKET_FILE}: {e}", file=sys.stderr)
+        return None
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    # Remove the socket at exit only if it's still the one bound here
+    bound_ino = SOCKET_FILE.stat().st_ino
+    socket_file = SOCKET_FILE
+
+    def remove_socket():
+        try:
+            if socket_file.stat().st_ino == bound_ino:
+                socket_file.unlink()
+        except OSError:
+            pass
+
+    atexit.register(remove_socket)
+    return server
 
 
 def cmd_install():
     """Print setup instructions."""
-    print("""ccusage setup
+    client = Path(__file__).with_name("statusline_client.py")
+    print(f"""ccusage setup
 =============
 
 1. Run the daemon (in a terminal, tmux, or systemd):
    ccusage daemon
 
 2. Configure Claude Code statusline in ~/.claude/settings.json:
-   {
-     "statusLine": {
+   {{
+     "statusLine": {{
        "type": "command",
        "command": "ccusage statusline"
-     }
-   }
+     }}
+   }}
 
 3. The statusline reads ~/.claude/usage-limits.json (written by the daemon)
    and shows: 5h session, 7d all-models, 7d Sonnet-specific limits.
+
+4. Optional, for the fastest statusline: while the daemon runs it also serves
+   rendered lines on {SOCKET_FILE}. Use this as the command instead
+   (falls back to `ccusage statusline` when the daemon isn't running):
+   {sys.executable} -S {client}
 """)
 
 
+USAGE = "usage: ccusage [-h] {status,json,daemon,statusline,install} ..."
+
+
+def _usage_error(message: str):
+    print(f"{USAGE}\nccusage: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+
+def _parse_interval(argv: list[str]) -> int:
+    """Parse the `daemon` options: -i/--interval SECS (also -iSECS, --interval=SECS)."""
+    interval = DAEMON_INTERVAL
+    args = iter(argv)
+    for arg in args:
+        if arg in ("-h", "--help"):
+            print(f"usage: ccusage daemon [-i SECS]\n\n"
+                  f"  -i, --interval SECS  Refresh interval in seconds (default: {DAEMON_INTERVAL})")
+            sys.exit(0)
+        if arg in ("-i", "--interval"):
+            value = next(args, None)
+        elif arg.startswith("--interval="):
+            value = arg.partition("=")[2]
+        elif arg.startswith("-i"):
+            value = arg[2:]
+        else:
+            _usage_error(f"unrecognized arguments: {arg}")
+        try:
+            interval = int(value)
+        except (TypeError, ValueError):
+            _usage_error(f"argument -i/--interval: invalid int value: {value!r}")
+        if interval < 1:
+            _usage_error("argument -i/--interval: must be a positive integer")
+    return interval
+
+
 def main():
-    parser = argparse.ArgumentParser(description="Claude Code usage monitor")
-    sub = parser.add_subparsers(dest="command")
-    sub.add_parser("status", help="Show current usage (default)")
-    sub.add_parser("json", help="Print raw JSON")
-    daemon_parser = sub.add_parser("daemon", help="Run refresh daemon")
-    daemon_parser.add_argument("-i", "--interval", type=int, default=DAEMON_INTERVAL,
-                               help=f"Refresh interval in seconds (default: {DAEMON_INTERVAL})")
-    sub.add_parser("statusline", help="Claude Code statusline (reads stdin + cache)")
-    sub.add_parser("install", help="Print setup instructions")
-    args = parser.parse_args()
-
-    cmd = args.command or "status"
-    if cmd == "status":
-        cmd_status()
-    elif cmd == "json":
-        cmd_status(raw_json=True)
-    elif cmd == "daemon":
-        cmd_daemon(interval=args.interval)
-    elif cmd == "statusline":
-        cmd_statusline()
-    elif cmd == "install":
-        cmd_install()
+    # Hand-rolled dispatch: argparse costs more to import and build than the
+    # statusline command itself, and only `daemon` takes an option.
+    argv = sys.argv[1:]
+    cmd = argv[0] if argv else "status"
+    if cmd in ("-h", "--help"):
+        print((__doc__ or USAGE).strip())
+        return
+    commands = {
+        "status": cmd_status,
+        "json": lambda: cmd_status(raw_json=True),
+        "daemon": lambda: cmd_daemon(interval=_parse_interval(argv[1:])),
+        "statusline": cmd_statusline,
+        "install": cmd_install,
+    }
+    if cmd not in commands:
+        _usage_error(f"invalid choice: {cmd!r}")
+    if cmd != "daemon" and len(argv) > 1:
+        _usage_error(f"unrecognized arguments: {' '.join(argv[1:])}")
+    commands[cmd]()
 
 
 if __name__ == "__main__":
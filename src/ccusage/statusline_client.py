@@ -0,0 +1,48 @@
+"""Minimal statusline client for a running `ccusage daemon`.
+
+Configure it as the Claude Code statusline command with `python3 -S`, e.g.
+`python3 -S /path/to/ccusage/statusline_client.py` (`ccusage install` prints
+the exact command). It forwards Claude Code's JSON to the daemon's Unix socket
+and prints the line the daemon renders, so a prompt redraw costs an
+interpreter start plus one local round trip. It must not import anything
+beyond the few stdlib modules below, and skipping site.py keeps startup low.
+
+If the daemon isn't running, it falls back to `ccusage statusline` in-process.
+"""
+
+import os
+import socket
+import sys
+
+SOCKET_FILE = os.path.join(os.path.expanduser("~"), ".claude", "ccusage.sock")
+
+
+def main():
+    data = sys.stdin.buffer.read()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.settimeout(2)
+            s.connect(SOCKET_FILE)
+            s.sendall(data)
+            s.shutdown(socket.SHUT_WR)
+            chunks = []
+            while chunk := s.recv(4096):
+                chunks.append(chunk)
+        line = b"".join(chunks)
+    except (OSError, AttributeError):
+        line = b""
+
+    if line:
+        sys.stdout.buffer.write(line)
+        return
+
+    # No daemon: render from the cache file like `ccusage statusline` does.
+    # The package sits next to this file, so it's importable even under -S.
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import ccusage
+
+    ccusage.cmd_statusline(data)
+
+
+if __name__ == "__main__":
+    main()